@@ -9,6 +9,7 @@ Features:
 - Configurable dealer behavior (draw at start, with player, or at end)
 - Smooth animations for card movements and flips with scaling effects
 - Sound effects for card draws, flips, and shuffling
+- Optional fast deal mode that skips card animations and result delays
 - Sequential dealing and dealer actions to match reference implementations
 - Professional UI with buttons and text inputs
 
@@ -26,6 +27,8 @@ import pygame
 import sys
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 pygame.init()
 pygame.mixer.init()
@@ -99,6 +102,35 @@ def get_font_size(base_size):
     scale = min(WIDTH / REFERENCE_WIDTH, HEIGHT / REFERENCE_HEIGHT)
     return max(12, int(base_size * scale))
 
+@lru_cache(maxsize=32)
+def load_font(size):
+    """
+    Load the default font at a pixel size, reusing fonts already built for that size.
+
+    The default font is loaded directly; going through SysFont would scan every installed
+    system font first just to fall back to the same default.
+
+    Args:
+        size (int): Font size in pixels.
+
+    Returns:
+        pygame.font.Font: The font.
+    """
+    return pygame.font.Font(None, size)
+
+# Every (num, suit_idx) pair in a standard 52-card deck, copied and shuffled on each reshuffle
+FULL_DECK = tuple((num, suit_idx) for num in range(1, 14) for suit_idx in range(1, 5))
+
+# Point value of each card number (index 0 unused; Aces count 1, face cards 10)
+RANK_VALUES = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+# Most cards a single-deck hand can hold without busting (A,A,A,A,2,2,2,2,3,3,3)
+MAX_HAND_CARDS = 11
+
+# The deck carries over between rounds and is reshuffled once fewer cards than this remain,
+# which is enough for both hands to reach their maximum in a single round
+RESHUFFLE_THRESHOLD = 2 * MAX_HAND_CARDS
+
 # Colors
 GREEN = (0, 100, 0)
 BLACK = (0, 0, 0)
@@ -122,35 +154,90 @@ def get_card_dimensions():
 base_dir = os.path.dirname(os.path.abspath(__file__))
 assets = os.path.join(base_dir, "bj_assets")
 
-# Card images: Dictionary mapping (suit, rank) to loaded images
+# Card images: Dictionary mapping (num, suit_idx) to scaled images. Keyed this way it is itself
+# the per-card image cache; get_card_image only adds the back/placeholder choice on top
 card_images = {}
-suits = ['clubs', 'diamonds', 'hearts', 'spades']
-ranks = ['a'] + [f"{i:02d}" for i in range(2, 11)] + ['j', 'q', 'k']
+suits = ('clubs', 'diamonds', 'hearts', 'spades')
+ranks = ('a',) + tuple(f"{i:02d}" for i in range(2, 11)) + ('j', 'q', 'k')
+
+def load_card_original(num, suit_idx):
+    """
+    Load the original (unscaled) image for a card face.
+
+    Args:
+        num (int): Card rank (1-13).
+        suit_idx (int): Suit index (1-4).
+
+    Returns:
+        pygame.Surface or None: Loaded image or None if the file does not exist.
+    """
+    # file names are only needed here; everything else keys cards by (num, suit_idx)
+    filename = f"card_{suits[suit_idx - 1]}_{ranks[num - 1]}.png"
+    # let the load itself report a missing file rather than stat-ing it first
+    try:
+        return pygame.image.load(os.path.join(assets, filename))
+    except FileNotFoundError:
+        return None
 
 # Store original images at 1:1 scale for dynamic resizing
+# PNG decoding releases the GIL, so the files are decoded on worker threads in parallel
 card_images_original = {}
-for suit in suits:
-    for rank in ranks:
-        path = os.path.join(assets, f"card_{suit}_{rank}.png")
-        if os.path.exists(path):
-            img = pygame.image.load(path)
-            card_images_original[(suit, rank)] = img
+with ThreadPoolExecutor() as pool:
+    back_red = pool.submit(pygame.image.load, os.path.join(assets, "card_back_red.png"))
+    back_blue = pool.submit(pygame.image.load, os.path.join(assets, "card_back_blue.png"))
+    for key, img in zip(FULL_DECK, pool.map(load_card_original, *zip(*FULL_DECK))):
+        if img is not None:
+            card_images_original[key] = img
+    card_back_red_original = back_red.result()
+    card_back_blue_original = back_blue.result()
+
+def scale_card_image(img, dims):
+    """
+    Scale a card image and convert it to the display's pixel format when a window exists.
 
-card_back_red_original = pygame.image.load(os.path.join(assets, "card_back_red.png"))
-card_back_blue_original = pygame.image.load(os.path.join(assets, "card_back_blue.png"))
+    Args:
+        img (pygame.Surface): Original card image.
+        dims (tuple): Target (width, height).
+
+    Returns:
+        pygame.Surface: The scaled image, ready for fast blitting.
+    """
+    scaled = pygame.transform.scale(img, dims)
+    # matching the display format up front means blits skip the per-pixel conversion
+    if pygame.display.get_surface() is not None:
+        scaled = scaled.convert_alpha()
+    return scaled
 
 def load_scaled_cards():
     """Load and scale card images to current screen dimensions."""
-    global card_images, card_back_red, card_back_blue
+    global card_images, card_back_red, card_back_blue, card_placeholder
     dims = get_card_dimensions()
     card_images = {}
-    for (suit, rank), img in card_images_original.items():
-        card_images[(suit, rank)] = pygame.transform.scale(img, dims)
-    card_back_red = pygame.transform.scale(card_back_red_original, dims)
-    card_back_blue = pygame.transform.scale(card_back_blue_original, dims)
+    for key, img in card_images_original.items():
+        card_images[key] = scale_card_image(img, dims)
+    card_back_red = scale_card_image(card_back_red_original, dims)
+    card_back_blue = scale_card_image(card_back_blue_original, dims)
+    # one blank surface shared by every card whose face image is missing
+    card_placeholder = pygame.Surface(dims)
+
+def get_card_image(num, suit_idx, is_back=False):
+    """
+    Get the scaled image for a card from the surfaces built by load_scaled_cards.
+
+    Args:
+        num (int): Card rank (1-13).
+        suit_idx (int): Suit index (1-4).
+        is_back (bool): Whether to return the card back instead of the face.
+
+    Returns:
+        pygame.Surface: The scaled card image.
+    """
+    if is_back:
+        return card_back_red if suit_idx in [2, 3] else card_back_blue
+    return card_images.get((num, suit_idx), card_placeholder)
 
-# Load initial scaled cards
-load_scaled_cards()
+# Scaled cards are loaded by Game.update_layout once the window exists, so they are
+# converted to the display format before the intro starts
 
 # Sounds: Prefer WAV but fallback to MP3 if available
 wav = lambda name: os.path.join(assets, name + ".wav")
@@ -167,29 +254,29 @@ def load_sound(name):
         pygame.mixer.Sound or None: Loaded sound object or None if not found.
     """
     # try wav first then mp3
-    path = wav(name) if os.path.exists(wav(name)) else (mp3(name) if os.path.exists(mp3(name)) else None)
-    if path:
+    for path in (wav(name), mp3(name)):
         try:
             return pygame.mixer.Sound(path)
+        except FileNotFoundError:
+            continue
         except Exception:
             return None
     return None
 
 
-def play_sound(snd, label):
+def sound_player(snd):
     """
-    Play a sound effect if available.
+    Pick how a sound effect is played once, so triggering it needs no checks.
 
     Args:
-        snd (pygame.mixer.Sound or None): Sound to play.
-        label (str): Label for debugging output.
+        snd (pygame.mixer.Sound or None): Loaded sound.
+
+    Returns:
+        callable: The sound's play method, or a no-op if the sound failed to load.
     """
     if snd:
-        try:
-            snd.play()
-            print(f"played sound: {label}")
-        except Exception as e:
-            print(f"error playing sound {label}: {e}")
+        return snd.play
+    return lambda: None
 
 
 draw_sound = load_sound("card_drawn")
@@ -210,6 +297,10 @@ print("sounds loaded:",
       "flip=" + str(bool(flip_sound)),
       "shuffle=" + str(bool(shuffle_sound)))
 
+play_draw_sound = sound_player(draw_sound)
+play_flip_sound = sound_player(flip_sound)
+play_shuffle_sound = sound_player(shuffle_sound)
+
 class Button:
     """
     Represents an interactive button with hover, selection, and enabled states.
@@ -445,7 +536,10 @@ class Card:
         self.anim_progress = 0.0
         self.start_pos = [0, 0]
         self.duration = 0.0
+        self.flip_duration = 0.5
         self.easing = None
+        # resolve the face up front so revealing mid-flip is a plain attribute swap
+        self.face_image = get_card_image(num, suit_idx)
         self.image = self.get_image()
         self.rect = self.image.get_rect()
 
@@ -457,10 +551,8 @@ class Card:
             pygame.Surface: The card's image.
         """
         if self.hidden:
-            return card_back_red if self.suit_idx in [2, 3] else card_back_blue
-        suit = suits[self.suit_idx - 1]
-        rank = ranks[self.num - 1]
-        return card_images.get((suit, rank), pygame.Surface((100, 150)))
+            return get_card_image(self.num, self.suit_idx, is_back=True)
+        return self.face_image
 
     def draw(self, screen):
         """
@@ -482,7 +574,7 @@ class Card:
                 screen.blit(img, rect)
             if self.flip_progress > 0.5 and self.hidden:
                 self.hidden = False
-                self.image = self.get_image()
+                self.image = self.face_image
         else:
             screen.blit(self.image, self.rect)
 
@@ -499,8 +591,7 @@ class Card:
                 self.anim_progress = 1.0
                 self.animating = False
                 self.pos = self.target_pos[:]
-                if self.on_finish:
-                    self.on_finish()
+                self.finish()
             else:
                 eased_progress = self.anim_progress
                 if self.easing == 'in_cubic':
@@ -509,14 +600,19 @@ class Card:
                     self.pos[i] = self.start_pos[i] + (self.target_pos[i] - self.start_pos[i]) * eased_progress
             self.rect.center = self.pos
         if self.flipping:
-            self.flip_progress += dt / 0.5
+            self.flip_progress += dt / self.flip_duration
             if self.flip_progress >= 1.0:
                 self.flipping = False
                 self.flip_progress = 0.0
                 self.hidden = False
-                self.image = self.get_image()
-                if self.on_finish:
-                    self.on_finish()
+                self.image = self.face_image
+                self.finish()
+
+    def finish(self):
+        """Run the pending on_finish callback once, clearing it first so it can never fire twice."""
+        on_finish, self.on_finish = self.on_finish, None
+        if on_finish:
+            on_finish()
 
     def move_to(self, pos, duration=0.5, easing=None, on_finish=None):
         """
@@ -528,6 +624,14 @@ class Card:
             easing (str or None): Easing type.
             on_finish (callable or None): Callback when animation completes.
         """
+        if duration <= 0:
+            # no animation requested, jump straight to the target
+            self.animating = False
+            self.pos = list(pos)
+            self.rect.center = self.pos
+            if on_finish:
+                on_finish()
+            return
         self.start_pos = self.pos[:]
         self.target_pos = list(pos)
         self.anim_progress = 0.0
@@ -536,21 +640,30 @@ class Card:
         self.on_finish = on_finish
         self.animating = True
 
-    def flip(self, on_finish=None):
+    def flip(self, on_finish=None, duration=0.5):
         """
         Start the flip animation to reveal the card.
 
         Args:
             on_finish (callable or None): Callback when flip completes.
+            duration (float): Flip duration in seconds; 0 reveals the card instantly.
         """
         if not self.hidden:
             if on_finish:
                 on_finish()
             return
+        if duration <= 0:
+            self.hidden = False
+            self.image = self.face_image
+            play_flip_sound()
+            if on_finish:
+                on_finish()
+            return
+        self.flip_duration = duration
         self.flipping = True
         self.flip_progress = 0.0
         self.on_finish = on_finish
-        play_sound(flip_sound, "flip")
+        play_flip_sound()
 
 class Game:
     """
@@ -569,6 +682,16 @@ class Game:
         And many more for managing animations, timers, and game data.
     """
 
+    # Round outcome messages indexed by the packed bits
+    # (player bust << 3) | (dealer bust << 2) | (player ahead << 1) | (player behind);
+    # once anyone busts the comparison bits don't matter, so each bust case fills four slots
+    RESULT_MESSAGES = (
+        ("It's a tie!", "You lose!", "You win!", "")
+        + ("You win! (dealer bust)",) * 4
+        + ("You lose! (bust)",) * 4
+        + ("It's a draw! (both bust)",) * 4
+    )
+
     def __init__(self):
         """
         Initialize the Game instance, setting up display, fonts, UI elements, and initial state.
@@ -581,27 +704,33 @@ class Game:
         self.intro_timer = 0.0
         self.dealer_mode = 1
         self.dealer_threshold = 16
+        self.fast_mode = False  # skip card animations and result delays
         # clear any pending timers so menu transition won't fire after start
         self.reset_timers()
-        self.used_cards = set()
+        self.deck = []
         self.player_cards = []
         self.dealer_cards = []
-        self.deck_pos = (WIDTH // 2, HEIGHT // 2)
+        # running hand totals (aces counted as 1) kept in step with the card lists
+        self._player_total = 0
+        self._player_aces = 0
+        self._dealer_total = 0
+        self._dealer_aces = 0
         self.intro_cards = []
         self.intro_phase = 0      # 0=fly out,1=gather back
         self.result_text = ""
         self.totals_text = ""
+        self.end_delay = 0.0      # seconds left showing the result before the play-again buttons
         self.timer_event = 0
         self.dealing = False
         self.deal_index = 0
         self.deal_cards = []
+        self.deal_pending = 0
         self.flipping = False
         self.flip_index = 0
         self.flip_cards = []
         self.player_stood = False
         self._dealer_playing = False
-        self.pending_dealer_turn = False
-        self.dealer_stood = False  # tracks when dealer decides to stand during "with player" mode
+        self.show_dealer_stand = False  # dealer stood during "with player" mode and the player hasn't yet
         # durations for intro animation will be computed when starting
         self.intro_out = 2.0
         self.intro_back = 2.0
@@ -611,15 +740,19 @@ class Game:
     
     def update_fonts(self):
         """Update font sizes based on current screen dimensions."""
-        self.font_large = pygame.font.SysFont(None, get_font_size(48))
-        self.font_medium = pygame.font.SysFont(None, get_font_size(36))
-        self.font_small = pygame.font.SysFont(None, get_font_size(24))
+        self.font_large = load_font(get_font_size(48))
+        self.font_medium = load_font(get_font_size(36))
+        self.font_small = load_font(get_font_size(24))
     
     def update_layout(self):
         """Recreate UI elements with scaled positions and sizes."""
         self.update_fonts()
         load_scaled_cards()
         
+        # Deck (pile) position that every dealt card starts from
+        self.deck_pos = (WIDTH // 2, HEIGHT // 2)
+        self.deck_rect = card_back_red.get_rect(center=self.deck_pos)
+        
         # Game buttons (hit/stand)
         button_width = get_scaled_value(100, 'dialog')
         spacing = get_scaled_value(50, 'dialog')
@@ -655,74 +788,137 @@ class Game:
         input_height = get_scaled_value(40, 'height')
         self.threshold_input = TextInput(WIDTH // 2 - input_width // 2, get_scaled_value(300, 'height'), input_width, input_height, self.font_small)
         
+        # Fast deal toggle
+        button_width = get_scaled_value(150, 'dialog')
+        self.fast_btn = Button(WIDTH // 2 - button_width // 2, get_scaled_value(380, 'height'), button_width, get_scaled_value(40, 'height'), "Fast Deal", self.font_small)
+        self.fast_btn.selected = self.fast_mode
+        
         # Play again buttons
         button_width = get_scaled_value(120, 'dialog')
         spacing = get_scaled_value(20, 'dialog')
         total_width = button_width * 2 + spacing
         start_x = WIDTH // 2 - total_width // 2
         y = HEIGHT // 2 + get_scaled_value(80, 'height')
-        self.play_again_btns = [
-            Button(start_x, y, button_width, get_scaled_value(40, 'height'), "Play Again", self.font_small),
-            Button(start_x + button_width + spacing, y, button_width, get_scaled_value(40, 'height'), "Menu", self.font_small)
-        ]
+        self.play_again_btns = []
+        self.play_again_actions = []
+        for i, (label, action) in enumerate((("Play Again", self.start_game), ("Menu", self.open_rules))):
+            x = start_x + i * (button_width + spacing)
+            self.play_again_btns.append(Button(x, y, button_width, get_scaled_value(40, 'height'), label, self.font_small))
+            self.play_again_actions.append(action)
+        
+        # Rules menu headings (static text, rendered once per layout rather than every frame)
+        self.rules_labels = []
+        for text, font, base_y in (("BLACKJACK", self.font_large, 50),
+                                   ("The Dealer should play:", self.font_medium, 120),
+                                   ("The Dealer has to draw on:", self.font_medium, 260)):
+            surf = font.render(text, True, WHITE)
+            self.rules_labels.append((surf, (WIDTH // 2 - surf.get_width() // 2, get_scaled_value(base_y, 'height'))))
+        
+        # Hand labels (static text, rendered once per layout rather than every frame)
+        self.dealer_label = self.font_medium.render("Dealer's hand:", True, WHITE)
+        self.dealer_label_pos = (get_scaled_value(50, 'width'), get_scaled_value(50, 'height'))
+        self.player_label = self.font_medium.render("Your hand:", True, WHITE)
+        self.player_label_pos = (get_scaled_value(50, 'width'), HEIGHT - get_scaled_value(300, 'height'))
+        self.dealer_stand_label = self.font_medium.render("STAND!", True, YELLOW)
+        
+        # Card slot positions for both hands
+        card_width, card_height = get_card_dimensions()
+        slot_x = get_scaled_value(100, 'width')
+        slot_step = card_width + get_scaled_value(60, 'width')
+        dealer_y = get_scaled_value(80, 'height') + card_height // 2
+        player_y = HEIGHT - get_scaled_value(270, 'height') + card_height // 2
+        self.dealer_card_positions = [(slot_x + i * slot_step, dealer_y) for i in range(MAX_HAND_CARDS)]
+        self.player_card_positions = [(slot_x + i * slot_step, player_y) for i in range(MAX_HAND_CARDS)]
+        # STAND! label spot to the right of the dealer's last card, indexed by that card's slot
+        stand_offset = card_width // 2 + get_scaled_value(20, 'width')
+        stand_y = get_scaled_value(80, 'height')
+        self.dealer_stand_positions = [(x + stand_offset, stand_y) for x, _ in self.dealer_card_positions]
+        
+        # Round result lines are rendered in end_game; re-render them at the new size if shown
+        if self.result_text:
+            self.render_result()
+
+    def render_result(self):
+        """Render the round result and totals lines once, so draw_game only blits them."""
+        self.result_label = self.font_large.render(self.result_text, True, YELLOW)
+        self.result_label_pos = (WIDTH // 2 - self.result_label.get_width() // 2, HEIGHT // 2 - get_scaled_value(50, 'height'))
+        self.totals_label = self.font_medium.render(self.totals_text, True, WHITE)
+        self.totals_label_pos = (WIDTH // 2 - self.totals_label.get_width() // 2, HEIGHT // 2)
     
     def get_dealer_card_pos(self, card_index):
         """Get scaled position for dealer card."""
-        card_width, card_height = get_card_dimensions()
-        # Base positioning at reference resolution
-        base_x = 100
-        base_spacing = 60
-        base_y = 80
-        
-        x = get_scaled_value(base_x, 'width') + card_index * (card_width + get_scaled_value(base_spacing, 'width'))
-        y = get_scaled_value(base_y, 'height') + card_height // 2
-        return (x, y)
+        return self.dealer_card_positions[card_index]
     
     def get_player_card_pos(self, card_index):
         """Get scaled position for player card."""
-        card_width, card_height = get_card_dimensions()
-        # Base positioning at reference resolution
-        base_x = 100
-        base_spacing = 60
-        base_y_offset = 270
-        
-        x = get_scaled_value(base_x, 'width') + card_index * (card_width + get_scaled_value(base_spacing, 'width'))
-        y = HEIGHT - get_scaled_value(base_y_offset, 'height') + card_height // 2
-        return (x, y)
+        return self.player_card_positions[card_index]
 
     def draw_card(self):
-        while True:
-            card = (random.randint(1, 13), random.randint(1, 4))
-            if card not in self.used_cards:
-                self.used_cards.add(card)
-                return card
+        """
+        Draw the next card from the shuffled deck.
+
+        Returns:
+            tuple: (num, suit_idx) of the drawn card.
+        """
+        return self.deck.pop()
 
-    def calculate_score(self, cards):
+    def _soft_score(self, total, aces):
         """
-        Calculate the Blackjack score for a list of cards, handling Aces optimally.
+        Turn a running hand total into a Blackjack score by counting one Ace as 11 if it fits.
 
         Args:
-            cards (list[Card]): List of cards to score.
+            total (int): Hand total with every Ace counted as 1.
+            aces (int): Number of Aces in the hand.
 
         Returns:
             int: The calculated score.
         """
-        if not cards:
-            return 0
-        nums = [c.num for c in cards]
-        total = sum(min(n, 10) for n in nums)
-        aces = nums.count(1)
-        while aces > 0 and total + 10 <= 21:
-            total += 10
-            aces -= 1
+        if aces and total + 10 <= 21:
+            return total + 10
         return total
 
+    def player_score(self):
+        """Get the player's current score from the running total."""
+        return self._soft_score(self._player_total, self._player_aces)
+
+    def dealer_score(self):
+        """Get the dealer's current score (including face-down cards) from the running total."""
+        return self._soft_score(self._dealer_total, self._dealer_aces)
+
+    def dealer_should_draw(self):
+        """Check whether the dealer is still under the draw threshold."""
+        return self.dealer_score() < self.dealer_threshold
+
+    def add_player_card(self, card):
+        """Add a card to the player's hand and update the running total."""
+        self.player_cards.append(card)
+        self._player_total += RANK_VALUES[card.num]
+        self._player_aces += card.num == 1
+
+    def add_dealer_card(self, card):
+        """Add a card to the dealer's hand and update the running total."""
+        self.dealer_cards.append(card)
+        self._dealer_total += RANK_VALUES[card.num]
+        self._dealer_aces += card.num == 1
+
+    def anim_duration(self, duration):
+        """
+        Get the duration to use for a card animation, honouring fast mode.
+
+        Args:
+            duration (float): Normal animation duration in seconds.
+
+        Returns:
+            float: The duration, or 0 when fast mode skips animations.
+        """
+        return 0 if self.fast_mode else duration
+
     def reset_timers(self):
         """
         Clear all pending timers to prevent unwanted state transitions.
         """
         # disable all user timers and clear state
-        for i in range(1, 5):
+        for i in range(1, 6):
             pygame.time.set_timer(pygame.USEREVENT + i, 0)
         self.timer_event = 0
 
@@ -772,6 +968,8 @@ class Game:
                 for i, btn in enumerate(self.mode_btns):
                     if btn.click(event.pos):
                         self.dealer_mode = i
+                if self.fast_btn.click(event.pos):
+                    self.fast_mode = not self.fast_mode
                 if self.start_btn.click(event.pos):
                     self.dealer_threshold = self.threshold_input.get_value()
                     self.state = 'game'
@@ -784,13 +982,14 @@ class Game:
                     self.player_hit()
                 elif self.stand_btn.enabled and self.stand_btn.click(event.pos) and not self.player_stood and not self._dealer_playing:
                     self.player_stood = True
+                    self.show_dealer_stand = False
                     self.dealer_turn()
         elif self.state == 'end':
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.play_again_btns[0].click(event.pos):
-                    self.start_game()
-                elif self.play_again_btns[1].click(event.pos):
-                    self.state = 'rules'
+                for btn, action in zip(self.play_again_btns, self.play_again_actions):
+                    if btn.click(event.pos):
+                        action()
+                        break
 
     def update(self, dt):
         """
@@ -801,20 +1000,28 @@ class Game:
         """
         mouse_pos = pygame.mouse.get_pos()
         if self.state == 'intro':
-            # manage timing for intro phases
+            # one shared clock moves every intro card, rather than each card running its own animation
             self.intro_timer += dt
-            if self.intro_phase == 0 and self.intro_timer >= self.intro_out:
+            duration = self.intro_out if self.intro_phase == 0 else self.intro_back
+            progress = min(self.intro_timer / duration, 1.0) if duration > 0 else 1.0
+            for card in self.intro_cards:
+                card.pos[0] = card.start_pos[0] + (card.target_pos[0] - card.start_pos[0]) * progress
+                card.pos[1] = card.start_pos[1] + (card.target_pos[1] - card.start_pos[1]) * progress
+                card.rect.center = card.pos
+            if self.intro_phase == 0 and progress >= 1.0:
                 # start gathering back
-                for card in self.intro_cards:
-                    card.move_to(self.deck_pos, self.intro_back, 'in_out_cubic')
+                self.gather_intro_cards()
                 self.intro_phase = 1
                 self.intro_timer = 0.0
-            elif self.intro_phase == 1 and self.intro_timer >= self.intro_back:
+            elif self.intro_phase == 1 and progress >= 1.0:
                 self.state = 'rules'
+                # intro is over, drop its cards so they stop being updated every frame
+                self.intro_cards = []
         elif self.state == 'rules':
             self.threshold_input.update(mouse_pos)
             for btn in self.mode_btns:
                 btn.update(mouse_pos)
+            self.fast_btn.update(mouse_pos)
             self.start_btn.update(mouse_pos)
             self.quit_btn.update(mouse_pos)
         elif self.state == 'game':
@@ -822,18 +1029,14 @@ class Game:
             self.stand_btn.update(mouse_pos)
             for card in self.player_cards + self.dealer_cards:
                 card.update(dt)
+            # count down the result display on the frame clock instead of a separate timer
+            if self.end_delay > 0:
+                self.end_delay -= dt
+                if self.end_delay <= 0:
+                    self.state = 'end'
         elif self.state == 'end':
             for btn in self.play_again_btns:
                 btn.update(mouse_pos)
-        for card in self.intro_cards:
-            card.update(dt)
-
-        # if dealer turn was queued while animations were running, trigger now
-        if self.pending_dealer_turn:
-            animating = any(c.animating for c in self.player_cards + self.dealer_cards)
-            if not animating:
-                self.pending_dealer_turn = False
-                self.dealer_turn()
 
     def draw(self):
         """
@@ -841,8 +1044,8 @@ class Game:
         """
         self.screen.fill(GREEN)
         if self.state == 'intro':
-            for card in self.intro_cards:
-                card.draw(self.screen)
+            # intro cards are face-down and never flip, so they all go out in one batched blit
+            self.screen.blits([(card.image, card.rect) for card in self.intro_cards], False)
         elif self.state == 'rules':
             self.draw_rules()
         elif self.state == 'game' or self.state == 'end':
@@ -852,56 +1055,38 @@ class Game:
                     btn.draw(self.screen)
 
     def draw_rules(self):
-        title = self.font_large.render("BLACKJACK", True, WHITE)
-        self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, get_scaled_value(50, 'height')))
-        dealer_text = self.font_medium.render("The Dealer should play:", True, WHITE)
-        self.screen.blit(dealer_text, (WIDTH // 2 - dealer_text.get_width() // 2, get_scaled_value(120, 'height')))
+        self.screen.blits(self.rules_labels, False)
         # update selection state
         for j, btn in enumerate(self.mode_btns):
             btn.selected = (j == self.dealer_mode)
             btn.draw(self.screen)
-        threshold_text = self.font_medium.render("The Dealer has to draw on:", True, WHITE)
-        self.screen.blit(threshold_text, (WIDTH // 2 - threshold_text.get_width() // 2, get_scaled_value(260, 'height')))
         self.threshold_input.draw(self.screen)
+        self.fast_btn.selected = self.fast_mode
+        self.fast_btn.draw(self.screen)
         self.start_btn.draw(self.screen)
         self.quit_btn.draw(self.screen)
 
     def draw_game(self):
-        dealer_label_x = get_scaled_value(50, 'width')
-        dealer_label_y = get_scaled_value(50, 'height')
-        dealer_text = self.font_medium.render("Dealer's hand:", True, WHITE)
-        self.screen.blit(dealer_text, (dealer_label_x, dealer_label_y))
+        self.screen.blit(self.dealer_label, self.dealer_label_pos)
         for card in self.dealer_cards:
             card.draw(self.screen)
-        # Show STAND! text when dealer stands during "with player" mode
-        if self.dealer_mode == 1 and self.dealer_stood and not self.player_stood:
-            stand_text = self.font_medium.render("STAND!", True, YELLOW)
-            # Position to the right of the dealer's last card
-            if self.dealer_cards:
-                last_card_x = self.dealer_cards[-1].rect.right + get_scaled_value(20, 'width')
-                self.screen.blit(stand_text, (last_card_x, get_scaled_value(80, 'height')))
+        # Show STAND! text to the right of the dealer's last card
+        if self.show_dealer_stand:
+            self.screen.blit(self.dealer_stand_label, self.dealer_stand_positions[len(self.dealer_cards) - 1])
         
-        player_label_x = get_scaled_value(50, 'width')
-        player_label_y = HEIGHT - get_scaled_value(300, 'height')
-        player_text = self.font_medium.render("Your hand:", True, WHITE)
-        self.screen.blit(player_text, (player_label_x, player_label_y))
+        self.screen.blit(self.player_label, self.player_label_pos)
         for card in self.player_cards:
             card.draw(self.screen)
         # Deck
-        deck_img = card_back_red  # or any back
-        deck_rect = deck_img.get_rect(center=self.deck_pos)
-        self.screen.blit(deck_img, deck_rect)
+        self.screen.blit(card_back_red, self.deck_rect)
         # Buttons
         if self.state == 'game':
             self.hit_btn.draw(self.screen)
             self.stand_btn.draw(self.screen)
         # Result
         if self.result_text:
-            result_surf = self.font_large.render(self.result_text, True, YELLOW)
-            self.screen.blit(result_surf, (WIDTH // 2 - result_surf.get_width() // 2, HEIGHT // 2 - get_scaled_value(50, 'height')))
-        if self.totals_text:
-            totals_surf = self.font_medium.render(self.totals_text, True, WHITE)
-            self.screen.blit(totals_surf, (WIDTH // 2 - totals_surf.get_width() // 2, HEIGHT // 2))
+            self.screen.blit(self.result_label, self.result_label_pos)
+            self.screen.blit(self.totals_label, self.totals_label_pos)
 
     def start_intro(self):
         # compute shuffle length, fall back to 2s; split into two halves so total animation
@@ -932,13 +1117,19 @@ class Game:
             card = Card(1, suit, hidden=True)
             card.pos = list(self.deck_pos)
             self.intro_cards.append(card)
-        # Animate out using shuffle length
+        # Animate out using shuffle length (update() moves the cards from start_pos to target_pos)
         for card in self.intro_cards:
             dx = random.randint(-WIDTH // 2, WIDTH // 2)
             dy = random.randint(-HEIGHT // 2, HEIGHT // 2)
-            end_pos = (self.deck_pos[0] + dx, self.deck_pos[1] + dy)
-            card.move_to(end_pos, self.intro_out, 'out_cubic')
-        play_sound(shuffle_sound, "shuffle")
+            card.start_pos = list(self.deck_pos)
+            card.target_pos = [self.deck_pos[0] + dx, self.deck_pos[1] + dy]
+        play_shuffle_sound()
+
+    def gather_intro_cards(self):
+        """Point every intro card back at the deck for the gather phase."""
+        for card in self.intro_cards:
+            card.start_pos = card.target_pos
+            card.target_pos = list(self.deck_pos)
 
     def handle_timer(self):
         # clear pending timer to avoid unwanted transitions
@@ -947,19 +1138,23 @@ class Game:
         self.reset_timers()
         if current == 1:
             # Gather back (reserved but not normally used anymore)
-            for card in self.intro_cards:
-                card.move_to(self.deck_pos, self.intro_back, 'in_out_cubic')
+            self.gather_intro_cards()
             self.timer_event = 2
-            pygame.time.set_timer(pygame.USEREVENT + 2, int(self.intro_back * 1000))
+            pygame.time.set_timer(pygame.USEREVENT + 2, int(self.intro_back * 1000), loops=1)
         elif current == 2:
             self.state = 'rules'
-        elif current == 3:
-            self.state = 'end'
+            self.intro_cards = []
         elif current == 4:
             self.on_reveal_done()
         elif current == 5:
             self.flip_next()
 
+    def open_rules(self):
+        """
+        Return to the rules menu from the end screen.
+        """
+        self.state = 'rules'
+
     def start_game(self):
         """
         Reset game state for a new round and begin dealing initial cards.
@@ -967,52 +1162,63 @@ class Game:
         # prepare for new round
         self.state = 'game'                    # <--- ensure state switches back
         self.reset_timers()
-        self.used_cards.clear()
+        if len(self.deck) < RESHUFFLE_THRESHOLD:
+            self.deck = list(FULL_DECK)
+            random.shuffle(self.deck)
         self.player_cards = []
         self.dealer_cards = []
+        self._player_total = 0
+        self._player_aces = 0
+        self._dealer_total = 0
+        self._dealer_aces = 0
         self.result_text = ""
         self.totals_text = ""
+        self.end_delay = 0.0
         self.player_stood = False
-        self.dealer_stood = False
+        self.show_dealer_stand = False
         # initially controls disabled until cards dealt
         self.hit_btn.enabled = False
         self.stand_btn.enabled = False
         self.deal_initial()
 
     def deal_initial(self):
-        self.deal_cards = []
+        # deal_cards holds batches of cards that fly out together: the dealer pair, then the player pair
+        self.deal_cards = [[], []]
         # Dealer 2
         for i in range(2):
             card_data = self.draw_card()
             card = Card(card_data[0], card_data[1], hidden=(i == 1))
-            self.dealer_cards.append(card)
+            self.add_dealer_card(card)
             card.pos = list(self.deck_pos)
             card.rect.center = card.pos
             target_pos = self.get_dealer_card_pos(i)
-            self.deal_cards.append((card, target_pos, 0.5))
+            self.deal_cards[0].append((card, target_pos, self.anim_duration(0.5)))
         # Player 2
         for i in range(2):
             card_data = self.draw_card()
             card = Card(card_data[0], card_data[1], hidden=False)
-            self.player_cards.append(card)
+            self.add_player_card(card)
             card.pos = list(self.deck_pos)
             card.rect.center = card.pos
             target_pos = self.get_player_card_pos(i)
-            self.deal_cards.append((card, target_pos, 0.5))
+            self.deal_cards[1].append((card, target_pos, self.anim_duration(0.5)))
         self.deal_index = 0
         self.dealing = True
         self.deal_next()
 
     def deal_next(self):
         if self.deal_index < len(self.deal_cards):
-            card, pos, duration = self.deal_cards[self.deal_index]
-            card.move_to(pos, duration, on_finish=self.on_deal_finish)
-            play_sound(draw_sound, "draw")
+            batch = self.deal_cards[self.deal_index]
             self.deal_index += 1
+            self.deal_pending = len(batch)
+            for card, pos, duration in batch:
+                card.move_to(pos, duration, on_finish=self.on_deal_finish)
+            play_draw_sound()
         else:
             self.dealing = False
+            self.deal_cards = []
             # Check blackjack or auto-start dealer draw
-            if self.calculate_score(self.player_cards) == 21:
+            if self.player_score() == 21:
                 self.dealer_turn()
             elif self.dealer_mode == 0:
                 # draw extra dealer cards then enable controls afterwards
@@ -1021,18 +1227,19 @@ class Game:
                 self.enable_controls()
 
     def on_deal_finish(self):
-        self.deal_next()
+        # move on once every card in the current batch has landed
+        self.deal_pending -= 1
+        if self.deal_pending == 0:
+            self.deal_next()
 
     def deal_extra_dealer(self, on_complete=None):
         # sequentially deal face-down cards from pile until threshold met
-        def cond():
-            return self.calculate_score(self.dealer_cards) < self.dealer_threshold
-        self.queue_dealer_draws(hidden=True, condition_fn=cond, callback=on_complete or (lambda: None))
+        self.queue_dealer_draws(hidden=True, condition_fn=self.dealer_should_draw, callback=on_complete)
 
     def player_hit(self):
         card_data = self.draw_card()
         card = Card(card_data[0], card_data[1], hidden=False)
-        self.player_cards.append(card)
+        self.add_player_card(card)
         card.pos = list(self.deck_pos)
         card.rect.center = card.pos
         target_pos = self.get_player_card_pos(len(self.player_cards) - 1)
@@ -1041,39 +1248,39 @@ class Game:
         self.hit_btn.enabled = False
         self.stand_btn.enabled = False
 
-        def after_draw():
-            score = self.calculate_score(self.player_cards)
-            if score >= 21:
-                # queue dealer turn until all animations complete
-                self.pending_dealer_turn = True
-            elif self.dealer_mode == 1:
-                self.dealer_react()
-            self.enable_controls()
+        card.move_to(target_pos, self.anim_duration(0.5), on_finish=self.on_player_draw_finish)
+        play_draw_sound()
 
-        card.move_to(target_pos, 0.5, on_finish=after_draw)
-        play_sound(draw_sound, "draw")
+    def on_player_draw_finish(self):
+        score = self.player_score()
+        if score >= 21:
+            # the card has landed and nothing else is moving, so the dealer can go straight away
+            self.dealer_turn()
+        elif self.dealer_mode == 1:
+            self.dealer_react()
+        self.enable_controls()
 
     def dealer_react(self):
-        if self.calculate_score(self.dealer_cards) < self.dealer_threshold:
+        if self.dealer_should_draw():
             card_data = self.draw_card()
             card = Card(card_data[0], card_data[1], hidden=True)
-            self.dealer_cards.append(card)
+            self.add_dealer_card(card)
             card.pos = list(self.deck_pos)
             card.rect.center = card.pos
             target_pos = self.get_dealer_card_pos(len(self.dealer_cards) - 1)
             # Disable buttons during animation
             self.hit_btn.enabled = False
             self.stand_btn.enabled = False
-            card.move_to(target_pos, 0.5, on_finish=self.enable_controls)
-            play_sound(draw_sound, "draw")
+            card.move_to(target_pos, self.anim_duration(0.5), on_finish=self.enable_controls)
+            play_draw_sound()
         else:
             # dealer stands (score >= threshold) during "with player" mode
-            self.dealer_stood = True
+            self.show_dealer_stand = True
             self.enable_controls()
 
     def enable_controls(self):
         # only allow buttons when player hasn't stood and hasn't busted or hit 21
-        if not self.player_stood and self.calculate_score(self.player_cards) < 21:
+        if not self.player_stood and self.player_score() < 21:
             self.hit_btn.enabled = True
             self.stand_btn.enabled = True
         else:
@@ -1105,62 +1312,65 @@ class Game:
         while condition_fn():
             card_data = self.draw_card()
             card = Card(card_data[0], card_data[1], hidden=hidden)
-            self.dealer_cards.append(card)
+            self.add_dealer_card(card)
             card.pos = list(self.deck_pos)
             card.rect.center = card.pos
             # Position is based on the card's index in dealer_cards
             target_pos = self.get_dealer_card_pos(len(self.dealer_cards) - 1)
-            self.dealer_queue.append((card, target_pos, 0.5))
+            self.dealer_queue.append((card, target_pos, self.anim_duration(0.5)))
         self.dealer_draw_index = 0
         self.dealer_draw_callback = callback
         if self.dealer_queue:
             self.dealer_draw_next()
         else:
             # nothing to draw, just call callback immediately
-            callback()
+            if callback:
+                callback()
 
     def dealer_draw_next(self):
         if self.dealer_draw_index < len(self.dealer_queue):
             card, pos, duration = self.dealer_queue[self.dealer_draw_index]
             self.dealer_draw_index += 1
             card.move_to(pos, duration, on_finish=self.dealer_draw_next)
-            play_sound(draw_sound, "draw")
+            play_draw_sound()
         else:
             # done
-            cb = getattr(self, 'dealer_draw_callback', None)
-            if cb:
-                self.dealer_draw_callback()
-                self.dealer_draw_callback = None
+            self.dealer_queue = []
+            # clear the callback before running it so it fires exactly once
+            callback, self.dealer_draw_callback = self.dealer_draw_callback, None
+            if callback:
+                callback()
 
     def flip_next(self):
         if self.flip_index < len(self.flip_cards):
-            self.flip_cards[self.flip_index].flip(on_finish=self.on_flip_finish)
+            card = self.flip_cards[self.flip_index]
             self.flip_index += 1
+            card.flip(on_finish=self.on_flip_finish, duration=self.anim_duration(0.5))
         else:
             self.flipping = False
             self.on_reveal_done()
 
     def on_flip_finish(self):
+        if self.fast_mode:
+            self.flip_next()
+            return
         # wait then trigger next flip via timer_event 5
         self.timer_event = 5
-        pygame.time.set_timer(pygame.USEREVENT + 5, 500)
+        pygame.time.set_timer(pygame.USEREVENT + 5, 500, loops=1)
 
     def on_reveal_done(self):
         if self.dealer_mode == 0:
             self.end_game()
-        elif self.dealer_mode == 1:
-            if self.calculate_score(self.dealer_cards) >= self.dealer_threshold:
-                self.end_game()
-            else:
-                self.dealer_auto_play()
         else:
             self.dealer_auto_play()
 
     def dealer_auto_play(self):
+        # dealer already at the threshold: nothing to queue, go straight to the result
+        if not self.dealer_should_draw():
+            self.end_game()
+            return
         # sequentially draw until threshold reached, then end game
-        def cond():
-            return self.calculate_score(self.dealer_cards) < self.dealer_threshold
-        self.queue_dealer_draws(hidden=False, condition_fn=cond, callback=self.end_game)
+        self.queue_dealer_draws(hidden=False, condition_fn=self.dealer_should_draw, callback=self.end_game)
 
     def end_game(self):
         """
@@ -1168,24 +1378,16 @@ class Game:
         """
         # dealer finished revealing, allow any UI cleanup
         self._dealer_playing = False
-        p_score = self.calculate_score(self.player_cards)
-        d_score = self.calculate_score(self.dealer_cards)
-        if p_score > 21 and d_score > 21:
-            msg = "It's a draw! (both bust)"
-        elif p_score > 21:
-            msg = "You lose! (bust)"
-        elif d_score > 21:
-            msg = "You win! (dealer bust)"
-        elif p_score > d_score:
-            msg = "You win!"
-        elif d_score > p_score:
-            msg = "You lose!"
-        else:
-            msg = "It's a tie!"
-        self.result_text = msg
+        p_score = self.player_score()
+        d_score = self.dealer_score()
+        outcome = (p_score > 21) << 3 | (d_score > 21) << 2 | (p_score > d_score) << 1 | (p_score < d_score)
+        self.result_text = self.RESULT_MESSAGES[outcome]
         self.totals_text = f"Your: {p_score} | Dealer: {d_score}"
-        self.timer_event = 3
-        pygame.time.set_timer(pygame.USEREVENT + 3, 2000)
+        self.render_result()
+        if self.fast_mode:
+            self.state = 'end'
+            return
+        self.end_delay = 2.0
 
 if __name__ == "__main__":
     game = Game()